@@ -1,6 +1,5 @@
 import * as fs from 'fs';
 import * as path from 'path';
-import * as yaml from 'js-yaml';
 
 /**
  * 設定ファイル読み込みエラー
@@ -200,7 +199,24 @@ export interface PatternRecognitionResult {
  */
 export class ConfigLoader {
   private static readonly configCache = new Map<string, any>();
-  
+
+  /** 遅延読み込みされたjs-yamlモジュール */
+  private static yamlModule: typeof import('js-yaml') | null = null;
+
+  /**
+   * js-yamlモジュールを取得（初回アクセス時に読み込み）
+   *
+   * ConfigLoaderをimportするだけのモジュールにYAMLパーサの
+   * 読み込みコストを負わせないため、実際のパース時まで遅延する
+   * @returns js-yamlモジュール
+   */
+  private static getYamlModule(): typeof import('js-yaml') {
+    if (!this.yamlModule) {
+      this.yamlModule = require('js-yaml');
+    }
+    return this.yamlModule!;
+  }
+
   /**
    * パターン層自律モジュール設定を読み込み
    * @param configPath - 設定ファイルパス（未指定時はデフォルトパス）
@@ -267,16 +283,21 @@ export class ConfigLoader {
     }
     
     try {
-      // ファイル存在確認
-      if (!fs.existsSync(filePath)) {
-        throw new ConfigLoadError(`File not found: ${filePath}`, filePath);
-      }
-      
       // ファイル読み込み
-      const fileContent = fs.readFileSync(filePath, 'utf8');
-      
+      // existsSyncによる事前確認は読み込みと合わせてファイルシステムへ
+      // 2回アクセスすることになるため、不在はENOENTとして直接扱う
+      let fileContent: string;
+      try {
+        fileContent = fs.readFileSync(filePath, 'utf8');
+      } catch (readError) {
+        if ((readError as NodeJS.ErrnoException).code === 'ENOENT') {
+          throw new ConfigLoadError(`File not found: ${filePath}`, filePath);
+        }
+        throw readError;
+      }
+
       // YAMLパース
-      const config = yaml.load(fileContent) as T;
+      const config = this.getYamlModule().load(fileContent) as T;
       
       if (!config) {
         throw new ConfigLoadError('Failed to parse YAML content', filePath);
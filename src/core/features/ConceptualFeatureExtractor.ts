@@ -67,7 +67,10 @@ interface ConceptualFeatureExtractorConfig {
  */
 class ConceptualVectorFeature implements VectorFeature {
   readonly type = 'conceptual_vector';
-  
+
+  /** 遅延計算したマグニチュードのキャッシュ（vectorは不変なので一度計算すれば十分） */
+  private cachedMagnitude: number | null = null;
+
   constructor(
     public readonly name: string,
     private readonly vector: number[],
@@ -94,13 +97,20 @@ class ConceptualVectorFeature implements VectorFeature {
   }
 
   isValid(): boolean {
-    return this.vector.length > 0 && 
+    return this.vector.length > 0 &&
            this.vector.every(v => isFinite(v) && !isNaN(v)) &&
            this.confidence >= 0 && this.confidence <= 1;
   }
 
   private calculateMagnitude(): number {
-    return Math.sqrt(this.vector.reduce((sum, v) => sum + v * v, 0));
+    if (this.cachedMagnitude === null) {
+      let sumOfSquares = 0;
+      for (let i = 0; i < this.vector.length; i++) {
+        sumOfSquares += this.vector[i] * this.vector[i];
+      }
+      this.cachedMagnitude = Math.sqrt(sumOfSquares);
+    }
+    return this.cachedMagnitude;
   }
 }
 
@@ -195,18 +205,34 @@ class FeatureCollectionImpl implements FeatureCollection {
 
   toVector(): number[] {
     const vector: number[] = [];
+    let offset = 0;
     for (const feature of this.features.values()) {
       if ('toVector' in feature && typeof feature.toVector === 'function') {
-        vector.push(...feature.toVector());
+        // spread構文による引数展開を避け、インデックス書き込みで結合する
+        const values = feature.toVector();
+        for (let i = 0; i < values.length; i++) {
+          vector[offset++] = values[i];
+        }
       } else {
-        vector.push(feature.value);
+        vector[offset++] = feature.value;
       }
     }
     return vector;
   }
 
   getDimension(): number {
-    return this.toVector().length;
+    // toVector()で全要素を実体化せず、各特徴量の次元数のみを合算する
+    let dimension = 0;
+    for (const feature of this.features.values()) {
+      if ('dimension' in feature && typeof (feature as any).dimension === 'number') {
+        dimension += (feature as any).dimension;
+      } else if ('toVector' in feature && typeof feature.toVector === 'function') {
+        dimension += feature.toVector().length;
+      } else {
+        dimension += 1;
+      }
+    }
+    return dimension;
   }
 
   getFeatureCount(): number {
@@ -239,6 +265,15 @@ export class ConceptualFeatureExtractor<T extends Context> implements LayerSpeci
   private readonly config: ConceptualFeatureExtractorConfig;
   private readonly performanceTracker: Map<string, number> = new Map();
 
+  /** 抽象化とスムージングを畳み込んだ定数係数（abstraction_factor × smoothing_factor） */
+  private readonly foldedAbstractionFactor: number;
+
+  /** 強調時の畳み込み済み定数係数（abstraction_factor × emphasis_factor × smoothing_factor） */
+  private readonly foldedEmphasisFactor: number;
+
+  /** 隣接影響の畳み込み済み定数係数（neighbor_influence × smoothing_factor） */
+  private readonly foldedNeighborFactor: number;
+
   /**
    * コンストラクタ
    * @param configPath - 設定ファイルのパス（省略時はデフォルト）
@@ -246,6 +281,13 @@ export class ConceptualFeatureExtractor<T extends Context> implements LayerSpeci
   constructor(configPath?: string) {
     // 一時的なデフォルト設定（js-yamlの問題回避）
     this.config = this.getDefaultConfig();
+
+    // 抽象化の定数係数は構築後に変化しないため、ここで一度だけ畳み込む
+    const abstraction = this.config.abstraction;
+    this.foldedAbstractionFactor = abstraction.abstraction_factor * abstraction.smoothing_factor;
+    this.foldedEmphasisFactor = this.foldedAbstractionFactor * abstraction.emphasis_factor;
+    this.foldedNeighborFactor = abstraction.neighbor_influence * abstraction.smoothing_factor;
+
     this.logInfo(`ConceptualFeatureExtractor initialized with default config`);
   }
 
@@ -389,12 +431,30 @@ export class ConceptualFeatureExtractor<T extends Context> implements LayerSpeci
       // 統計情報からの特徴抽出
       const stats = context.statistics;
       if (stats.size() > 0) {
-        const values = stats.values().filter(v => typeof v === 'number' && isFinite(v)) as number[];
-        if (values.length > 0) {
-          const mean = values.reduce((sum, v) => sum + v, 0) / values.length;
-          const variance = values.reduce((sum, v) => sum + (v - mean) ** 2, 0) / values.length;
+        // 合計・二乗和・最小・最大を1回の走査でまとめて集計する
+        // （Math.min/maxのspread呼び出しと複数回のreduceを避ける）
+        let count = 0;
+        let sum = 0;
+        let sumOfSquares = 0;
+        let min = Infinity;
+        let max = -Infinity;
+
+        for (const v of stats.values()) {
+          if (typeof v === 'number' && isFinite(v)) {
+            count++;
+            sum += v;
+            sumOfSquares += v * v;
+            if (v < min) min = v;
+            if (v > max) max = v;
+          }
+        }
+
+        if (count > 0) {
+          const mean = sum / count;
+          // 浮動小数点誤差でわずかに負になる場合があるため0でクランプする
+          const variance = Math.max(0, sumOfSquares / count - mean * mean);
           const standardDeviation = Math.sqrt(variance);
-          
+
           features.push(new ConceptualStatisticalFeature(
             'context_statistics',
             mean,
@@ -403,10 +463,10 @@ export class ConceptualFeatureExtractor<T extends Context> implements LayerSpeci
             mean,
             variance,
             standardDeviation,
-            [Math.min(...values), Math.max(...values)]
+            [min, max]
           ));
 
-          this.logDebug(`Extracted statistical feature from ${values.length} values, mean: ${mean.toFixed(3)}`);
+          this.logDebug(`Extracted statistical feature from ${count} values, mean: ${mean.toFixed(3)}`);
         }
       }
     } catch (error) {
@@ -495,38 +555,46 @@ export class ConceptualFeatureExtractor<T extends Context> implements LayerSpeci
    */
   private abstractVector(vector: number[]): number[] {
     const config = this.config.abstraction;
-    
-    const abstracted = vector.map((v, index) => {
-      // 基本的な抽象化（減衰）を適用
-      let processed = v * config.abstraction_factor;
-      
-      // 重要な特徴の強調処理
+    const n = vector.length;
+    const abstracted = new Array<number>(n);
+
+    // ログレベルの判定をループ外に出し、デバッグ出力が無効なときに
+    // 要素ごとのメッセージ文字列を組み立てないようにする
+    const debugEnabled = this.config.debug.log_level >= 4;
+
+    for (let index = 0; index < n; index++) {
+      const v = vector[index];
+
+      // 基本的な抽象化（減衰）・強調・スムージングの定数係数は
+      // コンストラクタで畳み込み済みのため、要素ごとの乗算は1回で済む
+      let processed: number;
       if (Math.abs(v) > config.significance_threshold) {
-        processed *= config.emphasis_factor;
-        this.logDebug(`Enhanced significant feature at index ${index}: ${v} -> ${processed}`);
+        processed = v * this.foldedEmphasisFactor;
+        if (debugEnabled) {
+          this.logDebug(`Enhanced significant feature at index ${index}: ${v} -> ${processed}`);
+        }
+      } else {
+        processed = v * this.foldedAbstractionFactor;
       }
-      
+
       // 隣接要素の影響を考慮（空間的相関）
       let neighborInfluence = 0;
       if (index > 0) {
-        neighborInfluence += vector[index - 1] * config.neighbor_influence;
+        neighborInfluence += vector[index - 1];
       }
-      if (index < vector.length - 1) {
-        neighborInfluence += vector[index + 1] * config.neighbor_influence;
+      if (index < n - 1) {
+        neighborInfluence += vector[index + 1];
       }
-      processed += neighborInfluence;
-      
-      // スムージング処理
-      processed *= config.smoothing_factor;
-      
-      return processed;
-    });
-    
+      processed += neighborInfluence * this.foldedNeighborFactor;
+
+      abstracted[index] = processed;
+    }
+
     // 正規化処理（設定に応じて）
     if (this.config.vector_processing.enable_normalization) {
       return this.normalizeVector(abstracted);
     }
-    
+
     return abstracted;
   }
 
@@ -558,28 +626,28 @@ export class ConceptualFeatureExtractor<T extends Context> implements LayerSpeci
       frequency.set(tag, (frequency.get(tag) || 0) + 1);
     });
     
+    // 重みの設定と同時に合計を集計し、正規化用の再走査を省く
     const total = tagTypes.length;
+    let sumWeights = 0;
     frequency.forEach((count, tag) => {
       let weight = count / total;
-      
+
       // 希少タグの重み増幅
       if (count === 1 && tagTypes.length > 1) {
         weight *= config.rare_tag_boost;
       }
-      
+
       weights.set(tag, weight);
+      sumWeights += weight;
     });
-    
-    // 正規化処理
-    if (config.normalize_weights) {
-      const sumWeights = Array.from(weights.values()).reduce((sum, w) => sum + w, 0);
-      if (sumWeights > 0) {
-        weights.forEach((weight, tag) => {
-          weights.set(tag, weight / sumWeights);
-        });
-      }
+
+    // 正規化処理（中間配列を作らずMapを直接更新）
+    if (config.normalize_weights && sumWeights > 0) {
+      weights.forEach((weight, tag) => {
+        weights.set(tag, weight / sumWeights);
+      });
     }
-    
+
     return weights;
   }
 
@@ -156,13 +156,18 @@ export class FeatureList {
    */
   toVector(): number[] {
     const vector: number[] = [];
+    let offset = 0;
     for (const feature of this.features) {
       if ('toVector' in feature && typeof feature.toVector === 'function') {
         // VectorFeatureの場合、ベクトルを展開
-        vector.push(...feature.toVector());
+        // spread構文は要素数分の引数展開を伴うため、インデックス書き込みで結合する
+        const values = feature.toVector();
+        for (let i = 0; i < values.length; i++) {
+          vector[offset++] = values[i];
+        }
       } else {
         // その他の特徴量は値をそのまま追加
-        vector.push(feature.value);
+        vector[offset++] = feature.value;
       }
     }
     return vector;
@@ -83,7 +83,10 @@ export class LinkIndex<T extends Experience, TLink> {
     const result: TLink[] = [];
     for (const [time, links] of this.byTime) {
       if (time >= startTime && time <= endTime) {
-        result.push(...links);
+        // push(...links)はバケットが大きいと引数展開のコストがかかるため要素単位で追加
+        for (const link of links) {
+          result.push(link);
+        }
       }
     }
     return result;
@@ -99,7 +102,9 @@ export class LinkIndex<T extends Experience, TLink> {
     const result: TLink[] = [];
     for (const [number, links] of this.byNumber) {
       if (number >= minValue && number <= maxValue) {
-        result.push(...links);
+        for (const link of links) {
+          result.push(link);
+        }
       }
     }
     return result;
@@ -118,7 +123,9 @@ export class LinkIndex<T extends Experience, TLink> {
     for (const [str, links] of this.byString) {
       const searchTarget = ignoreCase ? str.toLowerCase() : str;
       if (searchTarget.includes(searchPattern)) {
-        result.push(...links);
+        for (const link of links) {
+          result.push(link);
+        }
       }
     }
     return result;
@@ -154,10 +161,22 @@ export class LinkIndex<T extends Experience, TLink> {
    * インデックスのサイズを取得
    */
   size(): { time: number; string: number; number: number; total: number } {
-    const timeEntries = Array.from(this.byTime.values()).reduce((sum, links) => sum + links.length, 0);
-    const stringEntries = Array.from(this.byString.values()).reduce((sum, links) => sum + links.length, 0);
-    const numberEntries = Array.from(this.byNumber.values()).reduce((sum, links) => sum + links.length, 0);
-    
+    // Array.fromによる中間配列を作らず、各インデックスを直接1回だけ走査する
+    let timeEntries = 0;
+    for (const links of this.byTime.values()) {
+      timeEntries += links.length;
+    }
+
+    let stringEntries = 0;
+    for (const links of this.byString.values()) {
+      stringEntries += links.length;
+    }
+
+    let numberEntries = 0;
+    for (const links of this.byNumber.values()) {
+      numberEntries += links.length;
+    }
+
     return {
       time: timeEntries,
       string: stringEntries,
@@ -121,7 +121,12 @@ export abstract class BaseAutonomousLayer<T extends Context> implements Autonomo
     totalPatternsObserved: 0,
     totalModelUpdates: 0,
     lastActivityTimestamp: null as Date | null,
+    /** 処理時間のリングバッファ（上限到達後は最古の要素を上書き） */
     processingTimes: [] as number[],
+    /** リングバッファの次回書き込み位置 */
+    processingTimeWriteIndex: 0,
+    /** バッファ内の処理時間の合計（平均計算をO(1)にするための逐次更新値） */
+    processingTimeSum: 0,
     errors: [] as Error[]
   };
   
@@ -263,9 +268,10 @@ export abstract class BaseAutonomousLayer<T extends Context> implements Autonomo
     averageProcessingTime: number;
     isHealthy: boolean;
   } {
+    // 合計は記録時に逐次更新しているため、バッファの再集計は不要
     const processingTimes = this.statistics.processingTimes;
-    const averageProcessingTime = processingTimes.length > 0 
-      ? processingTimes.reduce((sum, time) => sum + time, 0) / processingTimes.length
+    const averageProcessingTime = processingTimes.length > 0
+      ? this.statistics.processingTimeSum / processingTimes.length
       : 0;
     
     // 健全性チェック（エラー率が10%未満かつ最近1時間以内に活動がある）
@@ -325,9 +331,18 @@ export abstract class BaseAutonomousLayer<T extends Context> implements Autonomo
     this.statistics.lastActivityTimestamp = new Date();
     
     // 処理時間を記録
-    this.statistics.processingTimes.push(processingTime);
-    if (this.statistics.processingTimes.length > this.maxStatisticsHistory) {
-      this.statistics.processingTimes.shift();
+    // shift()による先頭削除はO(n)のため、リングバッファ方式で最古の値を上書きする
+    const processingTimes = this.statistics.processingTimes;
+    if (processingTimes.length < this.maxStatisticsHistory) {
+      processingTimes.push(processingTime);
+      this.statistics.processingTimeSum += processingTime;
+    } else {
+      // 上書きで追い出される値を合計から差し引く
+      const writeIndex = this.statistics.processingTimeWriteIndex;
+      this.statistics.processingTimeSum += processingTime - processingTimes[writeIndex];
+      processingTimes[writeIndex] = processingTime;
+      this.statistics.processingTimeWriteIndex =
+        (writeIndex + 1) % this.maxStatisticsHistory;
     }
     
     // 操作別カウンタを更新
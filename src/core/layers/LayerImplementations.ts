@@ -7,7 +7,7 @@ import { LearningSignal } from '../learning/LearningSignalV2';
 import { DevelopOption } from '../../debug/DevelopOption';
 import { BaseAutonomousLayer } from './AutonomousLayer';
 import { ConceptualFeatureExtractor } from '../features/ConceptualFeatureExtractor';
-import { FeatureList } from '../features/FeatureCollections';
+import { Feature } from '../features/FeatureInterfaces';
 import { Tag } from '../tag/Tag';
 import { Statistics } from '../tag/Statistics';
 // import { ConfigLoader, PatternAutonomousLayerConfig, PatternType, PatternRecognitionResult } from '../config/ConfigLoader';
@@ -90,14 +90,16 @@ interface PatternAutonomousLayerConfig {
  * 最小限の骨格実装 - コンパイルエラー回避のため詳細ロジックは削除
  */
 export class SensoryAutonomousLayer<T extends VectorizableContext> extends BaseAutonomousLayer<T> {
-  
+
+  /** 既定の期待パターン本体（形状が固定なので呼び出しごとに作り直さない） */
+  private readonly defaultPattern = { toVector: () => new Array(10).fill(0) } as T;
+
   constructor(layerId: string, layerName: string = "感覚層") {
     super(layerId, layerName, "sensory");
   }
-  
+
   public generateExpectedPattern(_destinationID: string, _context: ContextInfo<T>): ExpectedPatternV2<T> {
-    const defaultPattern = { toVector: () => new Array(10).fill(0) } as T;
-    const contextInfo = new ContextInfo<T>(defaultPattern, new Set(), new Statistics());
+    const contextInfo = new ContextInfo<T>(this.defaultPattern, new Set(), new Statistics());
     return new ExpectedPatternV2<T>(contextInfo);
   }
   
@@ -118,11 +120,24 @@ export class PatternAutonomousLayer<T extends VectorizableContext> extends BaseA
   
   private readonly BURST_THRESHOLD = 0.75;
   private readonly config: PatternAutonomousLayerConfig;
-  
+
+  /** 設定から解決済みの特徴量活性化関数 */
+  private readonly featureActivation: (vector: number[]) => number[];
+
+  /** 宛先IDハッシュのキャッシュ */
+  private readonly destinationHashCache = new Map<string, number>();
+
+  /** バースト伝播用の現在状態パターン（fallback設定のみで決まるため一度だけ構築） */
+  private readonly currentStatePattern: T;
+
   constructor(layerId: string, layerName: string = "パターン層", configPath?: string) {
     super(layerId, layerName, "pattern");
     // 一時的なデフォルト設定（js-yamlの問題回避）
     this.config = this.getDefaultConfig();
+    this.featureActivation = this.resolveFeatureActivation();
+    this.currentStatePattern = this.createVectorizableContext(
+      new Array(this.config.fallback.default_vector_size).fill(this.config.fallback.default_vector_value)
+    );
     this.logInfo(`PatternAutonomousLayer initialized with default config`);
   }
 
@@ -229,11 +244,10 @@ export class PatternAutonomousLayer<T extends VectorizableContext> extends BaseA
   
   /**
    * 現在の層の状態をパターンとして返す（バースト伝播用）
+   * toVector()が防御的コピーを返すため、構築済みパターンの共有で問題ない
    */
   private getCurrentStateAsPattern(): T {
-    const defaultSize = this.config.fallback.default_vector_size;
-    const defaultValue = this.config.fallback.default_vector_value;
-    return this.createVectorizableContext(new Array(defaultSize).fill(defaultValue));
+    return this.currentStatePattern;
   }
 
   /**
@@ -254,18 +268,19 @@ export class PatternAutonomousLayer<T extends VectorizableContext> extends BaseA
    * @returns 認識されたパターン情報
    */
   private recognizePattern(context: ContextInfo<T>): PatternRecognitionResult {
-    const inputContext = context.body;
-    
-    const similarity = this.calculatePatternSimilarity(inputContext);
-    const patternType = this.classifyPattern(inputContext);
-    const intensity = this.calculatePatternIntensity(inputContext);
-    
+    // toVector()は防御的コピーを返すため、一度だけ実体化して各解析メソッドで共有する
+    const inputVector = context.body.toVector();
+
+    const similarity = this.calculatePatternSimilarity(inputVector);
+    const patternType = this.classifyPattern(inputVector);
+    const intensity = this.calculatePatternIntensity(inputVector);
+
     return {
       type: patternType,
       similarity: similarity,
       intensity: intensity,
       confidence: this.calculateConfidence(similarity, intensity),
-      features: this.extractPatternFeatures(inputContext)
+      features: this.extractPatternFeatures(inputVector)
     };
   }
 
@@ -351,51 +366,47 @@ export class PatternAutonomousLayer<T extends VectorizableContext> extends BaseA
   // 型安全なパターン処理メソッド群
 
   /**
-   * VectorizableContextから類似度を計算（型安全版）
-   * @param context - VectorizableContext
+   * 入力ベクトルから類似度を計算（型安全版）
+   * @param vector - 入力ベクトル
    * @returns 類似度 [0, 1]
    */
-  private calculatePatternSimilarity(context: T): number {
+  private calculatePatternSimilarity(vector: number[]): number {
     const config = this.config.pattern_recognition.similarity_calculation;
-    const vector = context.toVector();
     const magnitude = Math.sqrt(vector.reduce((sum, v) => sum + v * v, 0));
-    
+
     let normalizedMagnitude = magnitude;
     if (config.dimension_adjustment) {
-      normalizedMagnitude = magnitude / Math.sqrt(context.getDimension());
+      normalizedMagnitude = magnitude / Math.sqrt(vector.length);
     }
-    
+
     return Math.max(0, Math.min(1, normalizedMagnitude * config.magnitude_scaling));
   }
 
   /**
-   * VectorizableContextからパターンタイプを分類（型安全版）
-   * @param context - VectorizableContext
+   * 入力ベクトルからパターンタイプを分類（型安全版）
+   * @param vector - 入力ベクトル
    * @returns パターンタイプ
    */
-  private classifyPattern(context: T): PatternType {
+  private classifyPattern(vector: number[]): PatternType {
     const config = this.config.pattern_recognition.classification;
-    const vector = context.toVector();
-    const variance = this.calculateVectorVariance(vector);
-    const entropy = this.calculateVectorEntropy(vector);
-    
+    const { variance, entropy } = this.calculateVectorStatistics(vector);
+
     if (variance < config.variance_threshold_uniform) return 'uniform';
     if (entropy > config.entropy_threshold_random) return 'random';
-    if (this.isSequentialPattern(vector)) return 'sequential';
-    if (this.isSpatialPattern(vector)) return 'spatial';
+    const adjacentPattern = this.classifyByAdjacentDifferences(vector);
+    if (adjacentPattern) return adjacentPattern;
     if (this.isFrequencyPattern(vector)) return 'frequency';
     return 'complex';
   }
 
   /**
-   * VectorizableContextから強度を計算（型安全版）
-   * @param context - VectorizableContext
+   * 入力ベクトルから強度を計算（型安全版）
+   * @param vector - 入力ベクトル
    * @returns 強度 [0, 1]
    */
-  private calculatePatternIntensity(context: T): number {
+  private calculatePatternIntensity(vector: number[]): number {
     const config = this.config.pattern_recognition.intensity;
-    const vector = context.toVector();
-    
+
     let intensity: number;
     if (config.mean_abs_scaling) {
       intensity = vector.reduce((sum, v) => sum + Math.abs(v), 0) / vector.length;
@@ -420,24 +431,35 @@ export class PatternAutonomousLayer<T extends VectorizableContext> extends BaseA
   }
 
   /**
-   * VectorizableContextから特徴量を抽出（型安全版）
-   * @param context - VectorizableContext
+   * 入力ベクトルから特徴量を抽出（型安全版）
+   * @param vector - 入力ベクトル
    * @returns 特徴量配列
    */
-  private extractPatternFeatures(context: T): number[] {
+  private extractPatternFeatures(vector: number[]): number[] {
+    return this.featureActivation(vector);
+  }
+
+  /**
+   * 設定された活性化関数を解決
+   * 設定は構築後に変化しないため、呼び出しごとのswitch分岐を避けて
+   * コンストラクタで一度だけ束縛する
+   * @returns 活性化関数
+   */
+  private resolveFeatureActivation(): (vector: number[]) => number[] {
     const activationConfig = this.config.pattern_enhancement.feature_activation;
-    const vector = context.toVector();
-    
+
     switch (activationConfig.function) {
       case 'tanh':
-        return vector.map(v => Math.tanh(v));
+        return vector => vector.map(v => Math.tanh(v));
       case 'sigmoid':
-        return vector.map(v => 1 / (1 + Math.exp(-v)));
+        return vector => vector.map(v => 1 / (1 + Math.exp(-v)));
       case 'relu':
-        return vector.map(v => Math.max(0, v));
+        return vector => vector.map(v => Math.max(0, v));
       case 'linear':
       default:
-        return activationConfig.preserve_sign ? [...vector] : vector.map(v => Math.abs(v));
+        return activationConfig.preserve_sign
+          ? vector => [...vector]
+          : vector => vector.map(v => Math.abs(v));
     }
   }
 
@@ -470,36 +492,82 @@ export class PatternAutonomousLayer<T extends VectorizableContext> extends BaseA
 
   // ベクトル解析ヘルパーメソッド
 
-  private calculateVectorVariance(vector: number[]): number {
-    const mean = vector.reduce((sum, v) => sum + v, 0) / vector.length;
-    return vector.reduce((sum, v) => sum + (v - mean) ** 2, 0) / vector.length;
-  }
+  /**
+   * 分類に必要な分散とエントロピーを1回の走査で同時に計算する。
+   * 個別のreduce/mapを繰り返すよりも中間配列の生成と走査回数を削減できる。
+   * @param vector - 入力ベクトル
+   * @returns 分散とエントロピー
+   */
+  private calculateVectorStatistics(vector: number[]): { variance: number; entropy: number } {
+    const n = vector.length;
+    let sum = 0;
+    let sumAbs = 0;
+    const absValues = new Array<number>(n);
+
+    for (let i = 0; i < n; i++) {
+      const v = vector[i];
+      const abs = Math.abs(v);
+      sum += v;
+      sumAbs += abs;
+      absValues[i] = abs;
+    }
+
+    const mean = sum / n;
+    let sumSquaredDiff = 0;
+    let entropy = 0;
+
+    for (let i = 0; i < n; i++) {
+      const diff = vector[i] - mean;
+      sumSquaredDiff += diff * diff;
+      if (sumAbs > 0) {
+        const p = absValues[i] / sumAbs;
+        if (p > 0) {
+          entropy -= p * Math.log2(p);
+        }
+      }
+    }
 
-  private calculateVectorEntropy(vector: number[]): number {
-    const normalized = vector.map(v => Math.abs(v));
-    const sum = normalized.reduce((s, v) => s + v, 0);
-    if (sum === 0) return 0;
-    const probs = normalized.map(v => v / sum);
-    return -probs.reduce((entropy, p) => p > 0 ? entropy + p * Math.log2(p) : entropy, 0);
+    return { variance: sumSquaredDiff / n, entropy };
   }
 
-  private isSequentialPattern(vector: number[]): boolean {
+  /**
+   * 隣接要素の差分に基づくパターン判定（逐次・空間）
+   * 両判定が必要とする隣接ペアの走査を1回にまとめ、勾配配列の生成を避ける
+   * @param vector - 入力ベクトル
+   * @returns 該当するパターンタイプ、どちらにも該当しない場合null
+   */
+  private classifyByAdjacentDifferences(vector: number[]): PatternType | null {
     const config = this.config.pattern_recognition.classification;
-    let sequential = 0;
-    for (let i = 1; i < vector.length; i++) {
-      if (Math.abs(vector[i] - vector[i-1]) < 0.1) sequential++;
+    const pairCount = vector.length - 1;
+
+    // 隣接ペアが存在しない場合は判定不能（空ベクトルでpairCountが-1になり
+    // 勾配分散が0扱いで'spatial'と誤判定されるのを防ぐ）
+    if (pairCount <= 0) {
+      return null;
     }
-    return sequential / (vector.length - 1) > config.sequential_correlation_threshold;
-  }
 
-  private isSpatialPattern(vector: number[]): boolean {
-    const config = this.config.pattern_recognition.classification;
-    const gradients = [];
+    let sequentialCount = 0;
+    let gradientSum = 0;
+    let gradientSumOfSquares = 0;
+
     for (let i = 1; i < vector.length; i++) {
-      gradients.push(vector[i] - vector[i-1]);
+      const gradient = vector[i] - vector[i - 1];
+      if (Math.abs(gradient) < 0.1) sequentialCount++;
+      gradientSum += gradient;
+      gradientSumOfSquares += gradient * gradient;
+    }
+
+    if (sequentialCount / pairCount > config.sequential_correlation_threshold) {
+      return 'sequential';
+    }
+
+    const gradientMean = gradientSum / pairCount;
+    const gradientVariance = Math.max(0, gradientSumOfSquares / pairCount - gradientMean * gradientMean);
+    if (gradientVariance < config.spatial_gradient_variance_threshold) {
+      return 'spatial';
     }
-    const gradientVariance = this.calculateVectorVariance(gradients);
-    return gradientVariance < config.spatial_gradient_variance_threshold;
+
+    return null;
   }
 
   private isFrequencyPattern(vector: number[]): boolean {
@@ -520,16 +588,34 @@ export class PatternAutonomousLayer<T extends VectorizableContext> extends BaseA
   }
 
   private calculateSpatialFactor(destinationID: string): number {
-    const hash = destinationID.split('').reduce((sum, char) => sum + char.charCodeAt(0), 0);
+    const hash = this.hashDestinationID(destinationID);
     return (hash % 100) / 100;
   }
 
   private calculateFrequencyFromDestination(destinationID: string): number {
     const config = this.config.pattern_transformation.frequency;
-    const hash = destinationID.split('').reduce((sum, char) => sum + char.charCodeAt(0), 0);
+    const hash = this.hashDestinationID(destinationID);
     return (hash % config.frequency_scale) / config.frequency_scale * Math.PI;
   }
 
+  /**
+   * 宛先IDの文字コード和ハッシュを計算（キャッシュ付き）
+   * 宛先IDは層IDなど少数の固定値のため、生成ごとの再計算を避ける
+   * @param destinationID - 宛先ID
+   * @returns 文字コード和ハッシュ
+   */
+  private hashDestinationID(destinationID: string): number {
+    let hash = this.destinationHashCache.get(destinationID);
+    if (hash === undefined) {
+      hash = 0;
+      for (let i = 0; i < destinationID.length; i++) {
+        hash += destinationID.charCodeAt(i);
+      }
+      this.destinationHashCache.set(destinationID, hash);
+    }
+    return hash;
+  }
+
   // ログ出力メソッド
 
   private logError(message: string, error?: any): void {
@@ -575,13 +661,12 @@ export class ConceptAutonomousLayer<T extends Context> extends BaseAutonomousLay
       return new ExpectedPatternV2<T>(context);
     } else {
       try {
-        // 特徴量抽出 - 型安全なFeatureListを使用
+        // 特徴量抽出
+        // 抽出結果の配列をそのまま利用し、呼び出しごとのFeatureListへの詰め替えを避ける
         const extractedFeatures = this.featureExtractor.extract(context);
-        const featureList = new FeatureList();
-        extractedFeatures.forEach(feature => featureList.add(feature));
-        
+
         // 特徴量から期待パターンを構築
-        const prediction = this.buildPredictionFromFeatures(featureList, destinationID);
+        const prediction = this.buildPredictionFromFeatures(extractedFeatures, destinationID);
         const predictedContext = this.createPredictedContext(prediction, context);
         
         return new ExpectedPatternV2<T>(predictedContext);
@@ -604,13 +689,24 @@ export class ConceptAutonomousLayer<T extends Context> extends BaseAutonomousLay
 
   /**
    * 特徴量から予測を構築
-   * @param featureList - 抽出された特徴量
+   * @param features - 抽出された特徴量
    * @param destinationID - 目的地ID
    * @returns 予測ベクトル
    */
-  private buildPredictionFromFeatures(featureList: FeatureList, destinationID: string): number[] {
-    // 特徴量をベクトルに変換
-    const featureVector = featureList.toVector();
+  private buildPredictionFromFeatures(features: Feature[], destinationID: string): number[] {
+    // 特徴量をベクトルに変換（FeatureList.toVector相当の結合をその場で行う）
+    const featureVector: number[] = [];
+    let offset = 0;
+    for (const feature of features) {
+      if ('toVector' in feature && typeof feature.toVector === 'function') {
+        const values = feature.toVector();
+        for (let i = 0; i < values.length; i++) {
+          featureVector[offset++] = values[i];
+        }
+      } else {
+        featureVector[offset++] = feature.value;
+      }
+    }
     
     // 目的地IDに基づく変換（概念レベルでの抽象化）
     const destinationHash = destinationID.split('').reduce((sum, char) => sum + char.charCodeAt(0), 0);
@@ -51,7 +51,7 @@ export class InterLayerRelativeJudgementLink<T extends Context> {
   /** リンクのメタデータ */
   private readonly _metadata: Map<string, any> = new Map();
   
-  /** 判定履歴（最新N件を保持） */
+  /** 判定履歴（最新N件を保持するリングバッファ） */
   private readonly _judgementHistory: Array<{
     timestamp: Date;
     referenceDifference: RelativeDifference<T>;
@@ -59,9 +59,27 @@ export class InterLayerRelativeJudgementLink<T extends Context> {
     updateScope: UpdateScope;
     skipJudgement: SkipEnum;
   }> = [];
-  
+
   /** 履歴保持上限数 */
   private readonly _maxHistorySize: number = 100;
+
+  /** リングバッファ内の最古レコード位置（上限到達後に使用） */
+  private _judgementHistoryStart: number = 0;
+
+  /** 累計判定回数（履歴の保持上限に影響されない全期間のカウント） */
+  private _totalJudgements: number = 0;
+
+  /** スキップ種別ごとの累計回数 */
+  private readonly _skipCounts = new Map<SkipEnum, number>();
+
+  /** 差分マグニチュードの累計（平均計算用） */
+  private _totalDifferenceMagnitude: number = 0;
+
+  /** 学習率の累計（平均計算用） */
+  private _totalLearningRate: number = 0;
+
+  /** 最後に判定を記録した時刻 */
+  private _lastJudgementAt: Date | null = null;
   
   /**
    * コンストラクタ
@@ -210,9 +228,10 @@ export class InterLayerRelativeJudgementLink<T extends Context> {
   } {
     // 相対差分を計算
     const referenceDifference = this.calculateRelativeDifference(expected, actual);
-    
+
     // スキップ判定を最初に行う（効率化のため）
-    const skipJudgement = this.judgeCalculationSkip(referenceDifference);
+    // 差分は直前に生成済みのため、公開メソッド経由の再検証は不要
+    const skipJudgement = this._skipPolicy.judgeSkip(referenceDifference);
     
     // スキップの場合は簡易的な結果を返す
     if (skipJudgement === SkipEnum.FullSkip) {
@@ -230,10 +249,11 @@ export class InterLayerRelativeJudgementLink<T extends Context> {
     
     // 文脈情報を構築
     const context = referenceDifference.contextInfo;
-    
+
     // 学習率と更新スコープを決定
-    const learningRate = this.adjustLearningRate(referenceDifference, context);
-    const updateScope = this.determineUpdateScope(referenceDifference, context);
+    // 引数は検証済みのため、ポリシーを直接呼び出す
+    const learningRate = this._learningRatePolicy.learningRate(referenceDifference, context);
+    const updateScope = this._updateScopePolicy.scope(referenceDifference, context);
     
     const judgementResult = {
       referenceDifference,
@@ -285,10 +305,18 @@ export class InterLayerRelativeJudgementLink<T extends Context> {
     updateScope: UpdateScope;
     skipJudgement: SkipEnum;
   }> {
-    if (maxCount && maxCount > 0) {
-      return this._judgementHistory.slice(-maxCount);
+    const size = this._judgementHistory.length;
+    if (size === 0) {
+      return this._judgementHistory;
+    }
+
+    // リングバッファから時系列順（古い→新しい）に並べ直して返す
+    const count = maxCount && maxCount > 0 ? Math.min(maxCount, size) : size;
+    const ordered = new Array(count);
+    for (let k = 0; k < count; k++) {
+      ordered[k] = this._judgementHistory[(this._judgementHistoryStart + size - count + k) % size];
     }
-    return this._judgementHistory;
+    return ordered;
   }
   
   /**
@@ -335,29 +363,19 @@ export class InterLayerRelativeJudgementLink<T extends Context> {
     averageLearningRate: number;
     recentActivity: boolean;
   } {
-    const totalJudgements = this._judgementHistory.length;
-    const skipCounts = new Map<SkipEnum, number>();
-    
-    let totalMagnitude = 0;
-    let totalLearningRate = 0;
-    
-    for (const record of this._judgementHistory) {
-      // スキップ回数をカウント
-      const currentCount = skipCounts.get(record.skipJudgement) ?? 0;
-      skipCounts.set(record.skipJudgement, currentCount + 1);
-      
-      // 平均値計算用に累積
-      totalMagnitude += record.referenceDifference.magnitude;
-      totalLearningRate += record.learningRate.value;
-    }
-    
-    const averageDifferenceMagnitude = totalJudgements > 0 ? totalMagnitude / totalJudgements : 0;
-    const averageLearningRate = totalJudgements > 0 ? totalLearningRate / totalJudgements : 0;
-    
+    // 統計は記録時に逐次更新した累計から算出する
+    // 履歴の走査が不要になるうえ、リングバッファの保持上限を超えた
+    // 過去分も含む全期間の値を返せる
+    const totalJudgements = this._totalJudgements;
+    const skipCounts = new Map(this._skipCounts);
+
+    const averageDifferenceMagnitude = totalJudgements > 0 ? this._totalDifferenceMagnitude / totalJudgements : 0;
+    const averageLearningRate = totalJudgements > 0 ? this._totalLearningRate / totalJudgements : 0;
+
     // 最近の活動（過去10分以内に判定があったか）
-    const tenMinutesAgo = new Date(Date.now() - 10 * 60 * 1000);
-    const recentActivity = this._judgementHistory.some(record => record.timestamp > tenMinutesAgo);
-    
+    const tenMinutesAgo = Date.now() - 10 * 60 * 1000;
+    const recentActivity = this._lastJudgementAt !== null && this._lastJudgementAt.getTime() > tenMinutesAgo;
+
     return {
       totalJudgements,
       skipCounts,
@@ -377,14 +395,25 @@ export class InterLayerRelativeJudgementLink<T extends Context> {
     updateScope: UpdateScope;
     skipJudgement: SkipEnum;
   }): void {
-    this._judgementHistory.push({
+    const record = {
       timestamp: new Date(),
       ...judgementResult
-    });
-    
+    };
+
+    // 全期間の統計用累計を更新（getStatisticsでの履歴走査を不要にする）
+    this._totalJudgements++;
+    this._skipCounts.set(record.skipJudgement, (this._skipCounts.get(record.skipJudgement) ?? 0) + 1);
+    this._totalDifferenceMagnitude += record.referenceDifference.magnitude;
+    this._totalLearningRate += record.learningRate.value;
+    this._lastJudgementAt = record.timestamp;
+
     // 履歴サイズの上限管理
-    if (this._judgementHistory.length > this._maxHistorySize) {
-      this._judgementHistory.shift();
+    // shift()による先頭削除はO(n)のため、上限到達後は最古のレコードを上書きする
+    if (this._judgementHistory.length < this._maxHistorySize) {
+      this._judgementHistory.push(record);
+    } else {
+      this._judgementHistory[this._judgementHistoryStart] = record;
+      this._judgementHistoryStart = (this._judgementHistoryStart + 1) % this._maxHistorySize;
     }
   }
   
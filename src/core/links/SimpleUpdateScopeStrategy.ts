@@ -70,15 +70,16 @@ export class SimpleUpdateScopeStrategy<T extends Context> implements UpdateScope
 
     if (difference.magnitude < this.lowThreshold) {
       // 小さな差分: 集中的な更新
-      scopeSet = new Set(this.focusedScope);
+      scopeSet = this.focusedScope;
     } else if (difference.magnitude < this.highThreshold) {
       // 中程度の差分: 標準的な更新
-      scopeSet = new Set(this.defaultScope);
+      scopeSet = this.defaultScope;
     } else {
       // 大きな差分: 全体的な更新
-      scopeSet = new Set(this.fullScope);
+      scopeSet = this.fullScope;
     }
 
+    // UpdateScopeのコンストラクタが防御的コピーを行うため、ここでの複製は不要
     return new UpdateScope(scopeSet);
   }
 
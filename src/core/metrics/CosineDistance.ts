@@ -73,10 +73,7 @@ export class CosineDistance<T extends VectorizableContext> implements Difference
       normB += vectorB[i] * vectorB[i];
     }
     
-    normA = Math.sqrt(normA);
-    normB = Math.sqrt(normB);
-    
-    // ゼロベクトルの場合の処理
+    // ゼロベクトルの場合の処理（ノルムの2乗で判定できるためsqrt前に行う）
     if (normA === 0 || normB === 0) {
       if (normA === 0 && normB === 0) {
         return 1; // 両方ゼロベクトルの場合は類似度1（距離0）
@@ -84,8 +81,10 @@ export class CosineDistance<T extends VectorizableContext> implements Difference
         return 0; // 片方のみゼロベクトルの場合は類似度0（距離1）
       }
     }
-    
-    return dotProduct / (normA * normB);
+
+    // sqrt(normA) * sqrt(normB) == sqrt(normA * normB) なので
+    // 2回の平方根計算を1回にまとめる
+    return dotProduct / Math.sqrt(normA * normB);
   }
   
   /**
@@ -25,7 +25,14 @@ export class DistanceMetricFactoryImpl implements IDistanceMetricFactory {
     DistanceMetricType.KL_Divergence,
     DistanceMetricType.EMD
   ];
-  
+
+  /**
+   * 種別ごとの生成済みメトリクスのキャッシュ
+   * すべてのメトリクス実装はステートレスであるため、
+   * 種別ごとに一度生成したインスタンスを再利用できる
+   */
+  private readonly metricCache = new Map<DistanceMetricType, DifferenceDistanceMetric<any>>();
+
   /**
    * プライベートコンストラクタ（Singletonパターン）
    */
@@ -50,29 +57,39 @@ export class DistanceMetricFactoryImpl implements IDistanceMetricFactory {
    * @throws Error サポートされていない種別の場合
    */
   public resolve<T extends Context>(type: DistanceMetricType): DifferenceDistanceMetric<T> {
-    // サポート確認
-    if (!this.supportedTypes.includes(type)) {
-      throw new Error(`Unsupported distance metric type: ${type}. Supported types: ${this.supportedTypes.join(', ')}`);
+    // ステートレスなメトリクスは種別ごとに一度だけ生成し、以降は再利用する
+    const cached = this.metricCache.get(type);
+    if (cached) {
+      return cached as DifferenceDistanceMetric<T>;
     }
-    
+
+    let metric: DifferenceDistanceMetric<T>;
     switch (type) {
       case DistanceMetricType.L2:
-        return this.createL2Distance<T>();
-        
+        metric = this.createL2Distance<T>();
+        break;
+
       case DistanceMetricType.Cosine:
-        return this.createCosineDistance<T>();
-        
+        metric = this.createCosineDistance<T>();
+        break;
+
       case DistanceMetricType.KL_Divergence:
-        return this.createKLDivergence<T>();
-        
+        metric = this.createKLDivergence<T>();
+        break;
+
       case DistanceMetricType.EMD:
-        return this.createEMDDistance<T>();
-        
+        metric = this.createEMDDistance<T>();
+        break;
+
       default:
         // TypeScriptの網羅性チェックのため
+        // switch自体がサポート確認を兼ねるので、事前のincludesによる線形探索は不要
         const exhaustiveCheck: never = type;
-        throw new Error(`Unhandled distance metric type: ${exhaustiveCheck}`);
+        throw new Error(`Unsupported distance metric type: ${exhaustiveCheck}. Supported types: ${this.supportedTypes.join(', ')}`);
     }
+
+    this.metricCache.set(type, metric);
+    return metric;
   }
   
   /**
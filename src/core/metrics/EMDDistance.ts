@@ -18,6 +18,16 @@ export class EMDDistance<T extends VectorizableContext> implements DifferenceDis
   
   /** 収束判定の閾値 */
   private static readonly CONVERGENCE_THRESHOLD = 1e-8;
+
+  /** Gibbs kernelキャッシュの保持上限（ベクトル長ごとに1エントリ） */
+  private static readonly KERNEL_CACHE_LIMIT = 8;
+
+  /**
+   * ベクトル長をキーとするGibbs kernelのキャッシュ
+   * カーネルはベクトル長と固定の正則化パラメータのみで決まるため、
+   * 同じ次元の距離計算間で再利用できる
+   */
+  private static readonly kernelCache = new Map<number, number[][]>();
   
   /**
    * 期待パターンと実際パターン間のEMD距離を計算
@@ -93,62 +103,39 @@ export class EMDDistance<T extends VectorizableContext> implements DifferenceDis
    * @returns 近似EMD距離
    */
   private calculateEMDApprox(p: number[], q: number[]): number {
-    const n = p.length;
-    
-    // コスト行列を生成（位置の違いに基づく）
-    const costMatrix = this.generateCostMatrix(n);
-    
     // Sinkhorn-Knopp反復による近似解法
-    return this.sinkhornKnopp(p, q, costMatrix);
-  }
-  
-  /**
-   * コスト行列を生成（インデックス間の距離）
-   * @param size - 行列のサイズ
-   * @returns コスト行列
-   */
-  private generateCostMatrix(size: number): number[][] {
-    const matrix: number[][] = [];
-    
-    for (let i = 0; i < size; i++) {
-      matrix[i] = [];
-      for (let j = 0; j < size; j++) {
-        // インデックス間のL1距離をコストとする
-        matrix[i][j] = Math.abs(i - j);
-      }
-    }
-    
-    return matrix;
+    // コストはインデックス間のL1距離|i-j|で、必要時にその場で計算できるため
+    // 密なコスト行列は保持しない
+    return this.sinkhornKnopp(p, q);
   }
-  
+
   /**
    * Sinkhorn-Knopp反復による最適輸送計算
+   * コストにはインデックス間のL1距離|i-j|を使用する
    * @param p - 分布P
-   * @param q - 分布Q  
-   * @param costMatrix - コスト行列
+   * @param q - 分布Q
    * @returns 最適輸送コスト
    */
-  private sinkhornKnopp(p: number[], q: number[], costMatrix: number[][]): number {
+  private sinkhornKnopp(p: number[], q: number[]): number {
     const n = p.length;
     const lambda = 10; // 正則化パラメータ
     
     // Gibbs kernelの計算: K[i][j] = exp(-lambda * C[i][j])
-    const K: number[][] = [];
-    for (let i = 0; i < n; i++) {
-      K[i] = [];
-      for (let j = 0; j < n; j++) {
-        K[i][j] = Math.exp(-lambda * costMatrix[i][j]);
-      }
-    }
+    // ベクトル長ごとに一度だけ構築し、以降の距離計算では再利用する
+    const K = this.getGibbsKernel(n, lambda);
     
     // 初期化
-    let u = new Array(n).fill(1);
-    let v = new Array(n).fill(1);
-    
+    const u = new Array(n).fill(1);
+    const v = new Array(n).fill(1);
+    const uOld = new Array(n);
+
     // Sinkhorn反復
     for (let iter = 0; iter < EMDDistance.MAX_ITERATIONS; iter++) {
-      const uOld = [...u];
-      
+      // 収束判定用に前回値を退避（バッファを再利用し、反復ごとの配列生成を避ける）
+      for (let i = 0; i < n; i++) {
+        uOld[i] = u[i];
+      }
+
       // uの更新
       for (let i = 0; i < n; i++) {
         let sum = 0;
@@ -157,7 +144,7 @@ export class EMDDistance<T extends VectorizableContext> implements DifferenceDis
         }
         u[i] = p[i] / (sum + 1e-15);
       }
-      
+
       // vの更新
       for (let j = 0; j < n; j++) {
         let sum = 0;
@@ -166,13 +153,13 @@ export class EMDDistance<T extends VectorizableContext> implements DifferenceDis
         }
         v[j] = q[j] / (sum + 1e-15);
       }
-      
+
       // 収束判定
       let maxDiff = 0;
       for (let i = 0; i < n; i++) {
         maxDiff = Math.max(maxDiff, Math.abs(u[i] - uOld[i]));
       }
-      
+
       if (maxDiff < EMDDistance.CONVERGENCE_THRESHOLD) {
         break;
       }
@@ -183,33 +170,80 @@ export class EMDDistance<T extends VectorizableContext> implements DifferenceDis
     for (let i = 0; i < n; i++) {
       for (let j = 0; j < n; j++) {
         const transport = u[i] * K[i][j] * v[j];
-        totalCost += transport * costMatrix[i][j];
+        totalCost += transport * Math.abs(i - j);
       }
     }
-    
+
     return totalCost;
   }
   
+  /**
+   * Gibbs kernelを取得（キャッシュ付き）
+   * @param n - ベクトル長
+   * @param lambda - 正則化パラメータ
+   * @returns Gibbs kernel行列
+   */
+  private getGibbsKernel(n: number, lambda: number): number[][] {
+    const cached = EMDDistance.kernelCache.get(n);
+    if (cached) {
+      return cached;
+    }
+
+    // コストは|i-j|なので相異なる値はn個しかない
+    // 1次元テーブルにまとめて計算し、n^2回のMath.exp呼び出しを避ける
+    const expByDistance = new Array<number>(n);
+    for (let d = 0; d < n; d++) {
+      expByDistance[d] = Math.exp(-lambda * d);
+    }
+
+    const K: number[][] = [];
+    for (let i = 0; i < n; i++) {
+      K[i] = [];
+      for (let j = 0; j < n; j++) {
+        K[i][j] = expByDistance[Math.abs(i - j)];
+      }
+    }
+
+    // キャッシュサイズの上限管理（最も古く登録された次元から削除）
+    if (EMDDistance.kernelCache.size >= EMDDistance.KERNEL_CACHE_LIMIT) {
+      const oldestKey = EMDDistance.kernelCache.keys().next().value;
+      if (oldestKey !== undefined) {
+        EMDDistance.kernelCache.delete(oldestKey);
+      }
+    }
+    EMDDistance.kernelCache.set(n, K);
+
+    return K;
+  }
+
   /**
    * ベクトルを分布として正規化
    * @param vector - 入力ベクトル
    * @returns 正規化された分布（合計が1）
    */
   private normalizeToDistribution(vector: number[]): number[] {
-    // 負の値を0に切り詰め
-    const clampedVector = vector.map(value => Math.max(0, value));
-    
-    // 合計を計算
-    const sum = clampedVector.reduce((acc, value) => acc + value, 0);
-    
+    const n = vector.length;
+
+    // 負の値を0に切り詰めつつ合計を集計
+    // 中間配列を作らず、切り詰め結果を出力バッファに直接書き込む
+    const distribution = new Array<number>(n);
+    let sum = 0;
+    for (let i = 0; i < n; i++) {
+      const clamped = Math.max(0, vector[i]);
+      distribution[i] = clamped;
+      sum += clamped;
+    }
+
     // ゼロベクトルの場合は等確率分布を返す
     if (sum === 0 || !isFinite(sum)) {
-      const uniformProb = 1 / vector.length;
-      return new Array(vector.length).fill(uniformProb);
+      return distribution.fill(1 / n);
     }
-    
+
     // 正規化
-    return clampedVector.map(value => value / sum);
+    for (let i = 0; i < n; i++) {
+      distribution[i] /= sum;
+    }
+    return distribution;
   }
   
   /**
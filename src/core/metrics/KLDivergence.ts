@@ -89,23 +89,28 @@ export class KLDivergence<T extends VectorizableContext> implements DifferenceDi
    * @returns 正規化された確率分布（合計が1）
    */
   private normalizeToDistribution(vector: number[]): number[] {
-    // 負の値を0に切り詰め（確率は非負でなければならない）
-    const clampedVector = vector.map(value => Math.max(0, value));
-    
-    // 合計を計算
-    const sum = clampedVector.reduce((acc, value) => acc + value, 0);
-    
+    const n = vector.length;
+
+    // 負の値を0に切り詰めつつ合計を集計（確率は非負でなければならない）
+    // 中間配列を作らず、切り詰め結果を出力バッファに直接書き込む
+    const distribution = new Array<number>(n);
+    let sum = 0;
+    for (let i = 0; i < n; i++) {
+      const clamped = Math.max(0, vector[i]);
+      distribution[i] = clamped;
+      sum += clamped;
+    }
+
     // ゼロベクトルの場合は等確率分布を返す
     if (sum === 0 || !isFinite(sum)) {
-      const uniformProb = 1 / vector.length;
-      return new Array(vector.length).fill(uniformProb);
+      return distribution.fill(1 / n);
     }
-    
+
     // 正規化してepsilonで下限を設定（log(0)の回避）
-    return clampedVector.map(value => {
-      const normalized = value / sum;
-      return Math.max(normalized, KLDivergence.EPSILON);
-    });
+    for (let i = 0; i < n; i++) {
+      distribution[i] = Math.max(distribution[i] / sum, KLDivergence.EPSILON);
+    }
+    return distribution;
   }
   
   /**
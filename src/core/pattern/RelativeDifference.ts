@@ -245,7 +245,7 @@ export class RelativeDifference<T extends Context> {
       `  computedAt: ${this._computedAt.toISOString()}`,
       `  age: ${this.getAge()}ms`,
       `  tags: [${Array.from(this.contextInfo.tags).map(t => t.key).join(', ')}]`,
-      `  statistics: ${Object.keys(Object.fromEntries(this.contextInfo.statistics)).length} entries`,
+      `  statistics: ${this.contextInfo.statistics.size()} entries`,
       `  metadata: [${this.getMetadataKeys().join(', ')}]`,
       `}`
     ];
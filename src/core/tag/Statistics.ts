@@ -159,8 +159,9 @@ export class Statistics {
    * @param overwrite - 既存の値を上書きするか（デフォルト: true）
    */
   merge(other: Statistics, overwrite: boolean = true): void {
-    for (const [key, value] of other.entries()) {
-      if (overwrite || !this.has(key)) {
+    // entries()は配列を生成するため、内部Mapを直接イテレートする
+    for (const [key, value] of other.data) {
+      if (overwrite || !this.data.has(key)) {
         this.data.set(key, value);
       }
     }
@@ -172,9 +173,8 @@ export class Statistics {
    */
   clone(): Statistics {
     const cloned = new Statistics();
-    for (const [key, value] of this.data) {
-      cloned.data.set(key, value);
-    }
+    // Mapコンストラクタによる一括コピー（要素ごとのsetを繰り返すより高速）
+    cloned.data = new Map(this.data);
     return cloned;
   }
 